@@ -7,9 +7,11 @@ Date: 2024
 License: MIT
 """
 
+import os
 import lightkurve as lk
 import numpy as np
 import matplotlib.pyplot as plt
+from astropy.time import Time
 from astropy.timeseries import BoxLeastSquares
 from astropy.stats import sigma_clip
 import warnings
@@ -18,8 +20,12 @@ warnings.filterwarnings('ignore')
 # Configuration
 TARGET = "TIC 307210830"  # L 98-59
 KNOWN_PERIODS = [2.253, 3.690, 7.451]  # Known planets b, c, d
+KNOWN_MAX_DEPTH = 0.002  # Deepest known transit (planet d), fraction of flux
 HZ_PERIOD_MIN = 5.5   # Optimistic HZ inner edge (days)
 HZ_PERIOD_MAX = 25.0  # Optimistic HZ outer edge (days)
+BLS_DURATIONS = [0.05, 0.10, 0.20]  # Trial durations (days); M3V transits < 3 h for P < 30 d
+MIN_N_TRANSIT = 3  # Only search periods with at least this many transits
+CACHE_FILE = os.path.join("cache", f"{TARGET.replace(' ', '_')}_SPOC.npz")
 
 print("="*70)
 print("L 98-59 HABITABLE ZONE EXOPLANET SEARCH")
@@ -30,16 +36,35 @@ print("="*70)
 # ============================================================================
 print("\n[1/6] Downloading TESS data from MAST...")
 
-search_result = lk.search_lightcurve(TARGET, author='SPOC', mission='TESS')
-print(f"Found {len(search_result)} TESS observations")
-print(search_result)
-
-# Download all sectors
-lc_collection = search_result.download_all()
-print(f"\nDownloaded {len(lc_collection)} light curves")
+if os.path.exists(CACHE_FILE):
+    # Stitched light curve saved by a previous run
+    with np.load(CACHE_FILE) as cached:
+        lc = lk.LightCurve(
+            time=Time(cached['time'], format=str(cached['time_format']),
+                      scale=str(cached['time_scale'])),
+            flux=cached['flux'],
+            flux_err=cached['flux_err']
+        )
+    print(f"Loaded cached light curve: {CACHE_FILE}")
+else:
+    search_result = lk.search_lightcurve(TARGET, author='SPOC', mission='TESS')
+    print(f"Found {len(search_result)} TESS observations")
+    print(search_result)
+    
+    # Download all sectors
+    lc_collection = search_result.download_all()
+    print(f"\nDownloaded {len(lc_collection)} light curves")
+    
+    # Stitch together and cache (time float64, flux float32)
+    lc = lc_collection.stitch()
+    os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+    np.savez(CACHE_FILE,
+             time=np.asarray(lc.time.value, dtype=np.float64),
+             time_format=lc.time.format,
+             time_scale=lc.time.scale,
+             flux=np.asarray(lc.flux.value, dtype=np.float32),
+             flux_err=np.asarray(lc.flux_err.value, dtype=np.float32))
 
-# Stitch together
-lc = lc_collection.stitch()
 print(f"Combined light curve: {len(lc)} data points")
 print(f"Time span: {lc.time.value[0]:.1f} to {lc.time.value[-1]:.1f} BTJD")
 
@@ -48,8 +73,24 @@ print(f"Time span: {lc.time.value[0]:.1f} to {lc.time.value[-1]:.1f} BTJD")
 # ============================================================================
 print("\n[2/6] Preprocessing light curve...")
 
-# Remove outliers
-lc_clean = lc.remove_outliers(sigma=5)
+def mad_clip_mask(flux, sigma, min_depth=0.0):
+    """
+    Keep-mask for points within sigma robust (1.4826 * MAD) std of the
+    median, never cutting less than min_depth (fraction of median) below it
+    """
+    flux = np.asarray(flux, dtype=float)
+    med = np.nanmedian(flux)
+    deviation = flux - med
+    mad = np.nanmedian(np.abs(deviation))
+    if not mad > 0:
+        return np.isfinite(flux)
+    cut = sigma * 1.4826 * mad
+    return (deviation <= cut) & (deviation >= -max(cut, min_depth * abs(med)))
+
+# Remove outliers, keeping the lower cut below twice the deepest known
+# transit (NaN cadences are dropped too)
+lc_clean = lc[mad_clip_mask(lc.flux.value, sigma=5,
+                            min_depth=2 * KNOWN_MAX_DEPTH)]
 n_outliers = len(lc) - len(lc_clean)
 print(f"Removed {n_outliers} outliers ({n_outliers/len(lc)*100:.1f}%)")
 
@@ -60,31 +101,61 @@ print("Applied Savitzky-Golay detrending (window=401)")
 # Normalize
 lc_norm = lc_flat.normalize()
 
+# Plain float64 arrays for the BLS searches below (BLS cannot handle NaNs)
+lc_bls = lc_norm.remove_nans()
+time = np.asarray(lc_bls.time.value, dtype=np.float64)
+flux = np.asarray(lc_bls.flux.value, dtype=np.float64)
+flux_err = np.asarray(lc_bls.flux_err.value, dtype=np.float64)
+if not np.isfinite(flux_err).all():
+    flux_err = None
+bls = BoxLeastSquares(time, flux, dy=flux_err)
+
+def bls_period_grid(minimum_period, maximum_period, frequency_factor):
+    """
+    Ascending trial periods from astropy's autoperiod, capped so that at
+    least MIN_N_TRANSIT transits fall inside the observing baseline
+    """
+    baseline = time.max() - time.min()
+    maximum_period = min(maximum_period, baseline / (MIN_N_TRANSIT - 1))
+    periods = bls.autoperiod(BLS_DURATIONS,
+                             minimum_period=minimum_period,
+                             maximum_period=maximum_period,
+                             frequency_factor=frequency_factor)
+    # autoperiod rounds the number of frequencies, so it can overshoot
+    return periods[periods <= maximum_period]
+
 # ============================================================================
 # STEP 3: KNOWN PLANET RECOVERY (VALIDATION)
 # ============================================================================
 print("\n[3/6] Validating methodology - recovering known planets...")
 
+def top_periodogram_peaks(periods, power, n_peaks, exclusion):
+    """Indices of the n_peaks strongest periods, each > exclusion days apart"""
+    # Sort by period so every exclusion window is a contiguous slice
+    order = np.argsort(periods)
+    periods_sorted = periods[order]
+    power_left = power[order].astype(float)
+    
+    peaks = []
+    for i in range(n_peaks):
+        k = np.argmax(power_left)
+        peaks.append(order[k])
+        
+        # Mask this period for next iteration
+        lo = np.searchsorted(periods_sorted, periods_sorted[k] - exclusion, side='left')
+        hi = np.searchsorted(periods_sorted, periods_sorted[k] + exclusion, side='right')
+        power_left[lo:hi] = -np.inf
+    
+    return np.array(peaks)
+
 # Search full period range to find known planets
-pg_full = lc_norm.to_periodogram(
-    method='bls',
-    minimum_period=0.5,
-    maximum_period=30,
-    frequency_factor=500
-)
+pg_full = bls.power(bls_period_grid(0.5, 30, frequency_factor=500), BLS_DURATIONS)
 
 # Find top 5 periods
-top_periods = []
-pg_powers = []
-for i in range(5):
-    period = pg_full.period_at_max_power
-    power = pg_full.max_power
-    top_periods.append(period.value)
-    pg_powers.append(power.value)
-    
-    # Mask this period for next iteration
-    mask = np.abs(pg_full.period.value - period.value) > 0.1
-    pg_full = pg_full[mask]
+peaks = top_periodogram_peaks(pg_full.period, pg_full.power,
+                              n_peaks=5, exclusion=0.1)
+top_periods = pg_full.period[peaks]
+pg_powers = pg_full.power[peaks]
 
 print("\nTop 5 detected periods:")
 for i, (p, power) in enumerate(zip(top_periods, pg_powers)):
@@ -99,34 +170,24 @@ for i, (p, power) in enumerate(zip(top_periods, pg_powers)):
 # ============================================================================
 # STEP 4: HABITABLE ZONE SEARCH
 # ============================================================================
-print("\n[4/6] Searching habitable zone (5.5-25 days)...")
+# The transit-count cap may shorten the HZ range on short baselines
+hz_periods = bls_period_grid(HZ_PERIOD_MIN, HZ_PERIOD_MAX, frequency_factor=500)
+hz_searched = (hz_periods[0], hz_periods[-1])
+print(f"\n[4/6] Searching habitable zone ({hz_searched[0]:.1f}-{hz_searched[1]:.1f} days)...")
 
 # Focused BLS search in HZ
-pg_hz = lc_norm.to_periodogram(
-    method='bls',
-    minimum_period=HZ_PERIOD_MIN,
-    maximum_period=HZ_PERIOD_MAX,
-    frequency_factor=500
-)
+pg_hz = bls.power(hz_periods, BLS_DURATIONS)
 
 # Find HZ candidates
 hz_candidates = []
-for i in range(3):
-    period = pg_hz.period_at_max_power
-    power = pg_hz.max_power
-    depth = pg_hz.depth_at_max_power
-    duration = pg_hz.duration_at_max_power
-    
+for k in top_periodogram_peaks(pg_hz.period, pg_hz.power,
+                               n_peaks=3, exclusion=1.0):
     hz_candidates.append({
-        'period': period.value,
-        'power': power.value,
-        'depth': depth.value * 100,  # Convert to percentage
-        'duration': duration.value * 24  # Convert to hours
+        'period': pg_hz.period[k],
+        'power': pg_hz.power[k],
+        'depth': pg_hz.depth[k] * 100,  # Convert to percentage
+        'duration': pg_hz.duration[k] * 24  # Convert to hours
     })
-    
-    # Mask for next candidate
-    mask = np.abs(pg_hz.period.value - period.value) > 1.0
-    pg_hz = pg_hz[mask]
 
 print(f"\nFound {len(hz_candidates)} HZ candidate signals:")
 for i, cand in enumerate(hz_candidates):
@@ -141,31 +202,36 @@ for i, cand in enumerate(hz_candidates):
 # ============================================================================
 print("\n[5/6] Running bootstrap validation (N=50)...")
 
-def bootstrap_period(lc, period_estimate, n_bootstrap=50):
+def bootstrap_period(time, flux, flux_err, period_estimate, n_bootstrap=50,
+                     seed=None):
     """Bootstrap validation of period detection"""
-    periods = []
+    # Search near expected period, on one grid shared by every resample
+    period_grid = bls_period_grid(period_estimate - 0.5, period_estimate + 0.5,
+                                  frequency_factor=100)
+    
+    rng = np.random.default_rng(seed)
+    periods = np.empty(n_bootstrap)
+    base_err = np.ones_like(flux) if flux_err is None else flux_err
     
     for i in range(n_bootstrap):
-        # Resample with replacement
-        indices = np.random.choice(len(lc), size=len(lc), replace=True)
-        lc_boot = lc[indices]
-        
-        # Search near expected period
-        pg_boot = lc_boot.to_periodogram(
-            method='bls',
-            minimum_period=period_estimate - 0.5,
-            maximum_period=period_estimate + 0.5,
-            frequency_factor=100
-        )
+        # Resample with replacement, as per-point multiplicities: a point
+        # drawn w times enters the BLS likelihood with error / sqrt(w)
+        # (infinite error, i.e. zero weight, if it was not drawn)
+        weights = np.bincount(rng.integers(0, len(time), size=len(time)),
+                              minlength=len(time))
+        with np.errstate(divide='ignore'):
+            bls_boot = BoxLeastSquares(time, flux, base_err / np.sqrt(weights))
+        result = bls_boot.power(period_grid, BLS_DURATIONS)
         
-        periods.append(pg_boot.period_at_max_power.value)
+        periods[i] = result.period[np.argmax(result.power)]
     
-    return np.array(periods)
+    return periods
 
 # Validate first HZ candidate
 if hz_candidates:
     cand_period = hz_candidates[0]['period']
-    boot_periods = bootstrap_period(lc_norm, cand_period, n_bootstrap=50)
+    boot_periods = bootstrap_period(time, flux, flux_err, cand_period,
+                                    n_bootstrap=50)
     
     period_std = np.std(boot_periods)
     period_stability = period_std / cand_period
@@ -183,19 +249,19 @@ print("\n[6/6] Phase-folding candidates for visual inspection...")
 # Create comprehensive visualization
 fig = plt.figure(figsize=(16, 12))
 
-# Plot 1: Full light curve
+# Plot 1: Full light curve (strided 1-px markers keep rendering cheap)
 ax1 = plt.subplot(3, 3, 1)
-lc_norm.scatter(ax=ax1, s=1, c='k', alpha=0.3)
+step = max(1, len(lc_norm) // 20000)
+ax1.plot(lc_norm.time.value[::step], lc_norm.flux.value[::step], '.', ms=1, c='k', alpha=0.3)
 ax1.set_title('Full TESS Light Curve', fontweight='bold')
 ax1.set_xlabel('Time (BTJD)')
 ax1.set_ylabel('Normalized Flux')
 
 # Plot 2: Full periodogram
 ax2 = plt.subplot(3, 3, 2)
-search_result = lk.search_lightcurve(TARGET, author='SPOC', mission='TESS')
-lc_temp = search_result.download_all().stitch().flatten(window_length=401).normalize()
-pg_temp = lc_temp.to_periodogram(method='bls', minimum_period=0.5, maximum_period=30)
-pg_temp.plot(ax=ax2)
+ax2.plot(pg_full.period, pg_full.power, 'k-', lw=0.5)
+ax2.set_xlabel('Period [d]')
+ax2.set_ylabel('BLS Power')
 ax2.set_title('Full Periodogram (0.5-30d)', fontweight='bold')
 ax2.axvline(KNOWN_PERIODS[0], color='r', ls='--', alpha=0.5, label='Known planets')
 ax2.axvline(KNOWN_PERIODS[1], color='r', ls='--', alpha=0.5)
@@ -204,14 +270,11 @@ ax2.legend()
 
 # Plot 3: HZ periodogram
 ax3 = plt.subplot(3, 3, 3)
-pg_hz_plot = lc_norm.to_periodogram(
-    method='bls', 
-    minimum_period=HZ_PERIOD_MIN,
-    maximum_period=HZ_PERIOD_MAX
-)
-pg_hz_plot.plot(ax=ax3)
+ax3.plot(pg_hz.period, pg_hz.power, 'k-', lw=0.5)
+ax3.set_xlabel('Period [d]')
+ax3.set_ylabel('BLS Power')
 ax3.set_title('Habitable Zone Periodogram', fontweight='bold')
-ax3.axvspan(HZ_PERIOD_MIN, HZ_PERIOD_MAX, alpha=0.1, color='green', 
+ax3.axvspan(*hz_searched, alpha=0.1, color='green', 
             label='Habitable Zone')
 ax3.legend()
 
@@ -219,7 +282,10 @@ ax3.legend()
 for i, period in enumerate(KNOWN_PERIODS[:3]):
     ax = plt.subplot(3, 3, 4+i)
     lc_folded = lc_norm.fold(period=period)
-    lc_folded.scatter(ax=ax, s=1, c='red', alpha=0.5)
+    # Folded light curves are phase-sorted; bin only the plotted window
+    lo, hi = np.searchsorted(lc_folded.phase.value, [-0.2, 0.2])
+    ax.hexbin(lc_folded.phase.value[lo:hi], lc_folded.flux.value[lo:hi],
+              gridsize=(100, 50), cmap='Reds', mincnt=1, vmin=0)
     ax.set_title(f'Known Planet {chr(98+i)} (P={period}d)', fontweight='bold')
     ax.set_xlabel('Phase')
     ax.set_ylabel('Normalized Flux')
@@ -229,7 +295,8 @@ for i, period in enumerate(KNOWN_PERIODS[:3]):
 for i, cand in enumerate(hz_candidates[:3]):
     ax = plt.subplot(3, 3, 7+i)
     lc_folded = lc_norm.fold(period=cand['period'])
-    lc_folded.scatter(ax=ax, s=1, c='blue', alpha=0.5)
+    ax.hexbin(lc_folded.phase.value, lc_folded.flux.value,
+              gridsize=(100, 50), cmap='Blues', mincnt=1, vmin=0)
     ax.set_title(f'HZ Candidate {i+1} (P={cand["period"]:.2f}d)', 
                  fontweight='bold')
     ax.set_xlabel('Phase')
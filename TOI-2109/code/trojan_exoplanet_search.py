@@ -11,13 +11,99 @@ Theory:
 - L5 point: 60° behind planet (phase = +1/6)
 """
 
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 import lightkurve as lk
 import numpy as np
 import matplotlib.pyplot as plt
+from astropy.time import Time
 from scipy import stats
 import warnings
 warnings.filterwarnings('ignore')
 
+
+def _cache_path(cache_dir, target, author):
+    """On-disk cache file for a target's stitched light curve"""
+    return os.path.join(cache_dir, f"{target.replace(' ', '_')}_{author}.npz")
+
+
+def _save_lc(path, lc):
+    """Cache time (float64) and flux/flux_err (float32) of a light curve"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    np.savez(path,
+             time=np.asarray(lc.time.value, dtype=np.float64),
+             time_format=lc.time.format,
+             time_scale=lc.time.scale,
+             flux=np.asarray(lc.flux.value, dtype=np.float32),
+             flux_err=np.asarray(lc.flux_err.value, dtype=np.float32))
+
+
+def _load_lc(path):
+    """Rebuild a light curve cached by _save_lc"""
+    with np.load(path) as data:
+        time = Time(data['time'], format=str(data['time_format']),
+                    scale=str(data['time_scale']))
+        return lk.LightCurve(time=time, flux=data['flux'],
+                             flux_err=data['flux_err'])
+
+
+def _fast_median(a):
+    """
+    Median of a NaN-free 1-D array by selection with np.partition,
+    without np.median's per-call reduction overhead (NaN if empty)
+    """
+    n = a.size
+    if n == 0:
+        return np.nan
+    half = n // 2
+    if n & 1:
+        return np.partition(a, half)[half]
+    part = np.partition(a, (half - 1, half))
+    return 0.5 * (part[half - 1] + part[half])
+
+
+def _bin_median(phase, flux, phase_bins):
+    """
+    Median-bin a phase-sorted light curve
+
+    Each bin is a contiguous slice of the sorted arrays, located with a
+    single np.searchsorted call instead of one boolean mask per bin.
+
+    Returns (bin centers, binned flux) for the non-empty bins only.
+    """
+    idx = np.searchsorted(phase, phase_bins)
+    n = len(phase_bins) - 1
+    binned_flux = np.empty(n)
+    valid = np.zeros(n, dtype=bool)
+    for i in range(n):
+        if idx[i+1] > idx[i]:
+            binned_flux[i] = _fast_median(flux[idx[i]:idx[i+1]])
+            valid[i] = True
+    binned_phase = (phase_bins[:-1] + phase_bins[1:]) / 2
+    return binned_phase[valid], binned_flux[valid]
+
+
+def _mad_clip_mask(flux, sigma, min_depth=0.0):
+    """
+    Keep-mask for points within sigma robust standard deviations of the
+    median, with the standard deviation estimated as 1.4826 * MAD
+
+    Both tails are clipped (cosmic rays above, momentum dumps below), but
+    the lower cut sits at least min_depth (a fraction of the median flux)
+    below the median, so transits shallower than min_depth always survive.
+    One pass of two medians replaces astropy's iterative sigma clipping.
+    NaN fluxes are always rejected; nothing else is when MAD is zero.
+    """
+    flux = np.asarray(flux, dtype=float)
+    med = np.nanmedian(flux)
+    deviation = flux - med
+    mad = np.nanmedian(np.abs(deviation))
+    if not mad > 0:
+        return np.isfinite(flux)
+    cut = sigma * 1.4826 * mad
+    return (deviation <= cut) & (deviation >= -max(cut, min_depth * abs(med)))
+
 class TrojanSearch:
     """Search for Trojan exoplanets at L4/L5 Lagrange points"""
     
@@ -45,8 +131,22 @@ class TrojanSearch:
         self.lc_clean = None
         self.results = {}
         
-    def download_data(self, author='SPOC'):
-        """Download TESS data"""
+        # Folded light curve and phase-sorted arrays (see _get_folded)
+        self._folded = None
+        self._sort_idx = None
+        self._phase_sorted = None
+        self._flux_sorted = None
+        self._flux_shift = None
+        self._flux_cumsum = None
+        self._flux2_cumsum = None
+        
+    def download_data(self, author='SPOC', cache_dir='cache'):
+        """
+        Download TESS data
+        
+        The stitched light curve is cached in cache_dir so repeat runs skip
+        the MAST query and download; pass cache_dir=None to always download.
+        """
         print(f"\n{'='*70}")
         print(f"TROJAN EXOPLANET SEARCH: {self.target}")
         print(f"{'='*70}")
@@ -55,12 +155,19 @@ class TrojanSearch:
         print(f"  Depth: {self.known_depth} ppm")
         
         print(f"\n[1/5] Downloading TESS data...")
-        search = lk.search_lightcurve(self.target, author=author, mission='TESS')
-        print(f"Found {len(search)} observations")
-        
-        # Download all available data
-        lc_collection = search.download_all()
-        self.lc = lc_collection.stitch()
+        cache_path = _cache_path(cache_dir, self.target, author) if cache_dir else None
+        if cache_path and os.path.exists(cache_path):
+            self.lc = _load_lc(cache_path)
+            print(f"Loaded cached light curve: {cache_path}")
+        else:
+            search = lk.search_lightcurve(self.target, author=author, mission='TESS')
+            print(f"Found {len(search)} observations")
+            
+            # Download all available data
+            lc_collection = search.download_all()
+            self.lc = lc_collection.stitch()
+            if cache_path:
+                _save_lc(cache_path, self.lc)
         
         print(f"Total data points: {len(self.lc)}")
         print(f"Time span: {self.lc.time.value[-1] - self.lc.time.value[0]:.1f} days")
@@ -69,8 +176,11 @@ class TrojanSearch:
         """Clean and detrend light curve"""
         print(f"\n[2/5] Preprocessing...")
         
-        # Remove outliers
-        self.lc_clean = self.lc.remove_outliers(sigma=5)
+        # Remove outliers; the lower cut stays below twice the known
+        # transit depth so deep transits (e.g. TOI-2109 b) are not clipped
+        keep = _mad_clip_mask(self.lc.flux.value, sigma=5,
+                              min_depth=2 * self.known_depth * 1e-6)
+        self.lc_clean = self.lc[keep]
         n_removed = len(self.lc) - len(self.lc_clean)
         print(f"  Removed {n_removed} outliers")
         
@@ -81,21 +191,84 @@ class TrojanSearch:
         self.lc_clean = self.lc_clean.normalize()
         print(f"  Detrended and normalized")
         
+        # float32 is ample for normalized TESS flux (~1e-4 precision) and
+        # halves the memory traffic of every sort, slice and median below
+        self.lc_clean.flux = self.lc_clean.flux.astype(np.float32)
+        self.lc_clean.flux_err = self.lc_clean.flux_err.astype(np.float32)
+        
+        # Invalidate any fold of a previous light curve
+        self._folded = None
+        
+    def _get_folded(self):
+        """Fold at the planet period once and cache phase-sorted arrays"""
+        if self._folded is None:
+            self._folded = self.lc_clean.fold(period=self.period,
+                                              epoch_time=self.epoch)
+            self._sort_idx = np.argsort(self._folded.phase.value)
+            # Phase stays float64 to match the searchsorted query edges
+            self._phase_sorted = self._folded.phase.value[self._sort_idx]
+            self._flux_sorted = self._folded.flux.value[self._sort_idx]
+            
+            # Prefix sums of (shifted) flux and flux^2 for _window_stats;
+            # shifting by the mean keeps the variance free of cancellation,
+            # and the sums accumulate in float64 even for float32 flux
+            self._flux_shift = np.mean(self._flux_sorted, dtype=np.float64)
+            shifted = self._flux_sorted - self._flux_shift
+            self._flux_cumsum = np.concatenate(
+                ([0.0], np.cumsum(shifted, dtype=np.float64)))
+            self._flux2_cumsum = np.concatenate(
+                ([0.0], np.cumsum(shifted**2, dtype=np.float64)))
+        return self._folded
+        
+    def _phase_slices(self, *ranges):
+        """
+        Slices of the phase-sorted arrays with phase_min <= phase < phase_max
+        for each (phase_min, phase_max) range, all edges located with a
+        single np.searchsorted call
+        """
+        edges = np.searchsorted(self._phase_sorted, np.ravel(ranges))
+        return [slice(lo, hi) for lo, hi in edges.reshape(-1, 2)]
+        
+    def _phase_slice(self, phase_min, phase_max):
+        """Slice of the phase-sorted arrays with phase_min <= phase < phase_max"""
+        return self._phase_slices((phase_min, phase_max))[0]
+        
+    def _window_stats(self, *windows):
+        """
+        Number of points, mean and standard deviation of the folded flux
+        over the union of one or more phase-sorted slices, in O(1) per
+        slice from the cached prefix sums
+        """
+        n = int(sum(w.stop - w.start for w in windows))
+        if n == 0:
+            return 0, np.nan, np.nan
+        total = sum(self._flux_cumsum[w.stop] - self._flux_cumsum[w.start]
+                    for w in windows)
+        total2 = sum(self._flux2_cumsum[w.stop] - self._flux2_cumsum[w.start]
+                     for w in windows)
+        mean = total / n
+        var = max(total2 / n - mean**2, 0.0)
+        return n, mean + self._flux_shift, np.sqrt(var)
+        
     def validate_known_planet(self):
         """Verify we can detect the known planet"""
         print(f"\n[3/5] Validating known planet detection...")
         
         # Fold at known period
-        lc_folded = self.lc_clean.fold(period=self.period, epoch_time=self.epoch)
+        self._get_folded()
+        flux = self._flux_sorted
         
         # Measure transit depth
-        # Define in-transit window (phase = 0 ± 0.02)
-        in_transit = np.abs(lc_folded.phase.value) < 0.02
-        out_transit = (np.abs(lc_folded.phase.value) > 0.1) & \
-                      (np.abs(lc_folded.phase.value) < 0.4)
+        # Define in-transit window (phase = 0 ± 0.02) and out-of-transit
+        # window (0.1 < |phase| < 0.4) as index ranges
+        in_transit, *out_transit = self._phase_slices(
+            (-0.02, 0.02),
+            (-0.4, -0.1),
+            (0.1, 0.4)
+        )
         
-        flux_in = np.median(lc_folded.flux[in_transit].value)
-        flux_out = np.median(lc_folded.flux[out_transit].value)
+        flux_in = _fast_median(flux[in_transit])
+        flux_out = _fast_median(np.concatenate([flux[w] for w in out_transit]))
         
         depth_measured = (1 - flux_in/flux_out) * 1e6  # ppm
         
@@ -110,7 +283,7 @@ class TrojanSearch:
         print(f"\n[4/5] Searching Lagrange points...")
         
         # Fold light curve at planet period
-        lc_folded = self.lc_clean.fold(period=self.period, epoch_time=self.epoch)
+        self._get_folded()
         
         # L4 point: -60° = -1/6 orbital phase
         # L5 point: +60° = +1/6 orbital phase
@@ -118,24 +291,26 @@ class TrojanSearch:
         L5_phase = +1/6
         phase_width = 0.05  # ±5% of orbit around L4/L5
         
-        # Define regions
-        L4_mask = np.abs(lc_folded.phase.value - L4_phase) < phase_width
-        L5_mask = np.abs(lc_folded.phase.value - L5_phase) < phase_width
-        baseline_mask = (np.abs(lc_folded.phase.value) > 0.3) & \
-                        (np.abs(lc_folded.phase.value) < 0.65)
+        # Define regions as index ranges (baseline is 0.3 < |phase| < 0.65)
+        L4_window, L5_window, *baseline_windows = self._phase_slices(
+            (L4_phase - phase_width, L4_phase + phase_width),
+            (L5_phase - phase_width, L5_phase + phase_width),
+            (-0.65, -0.3),
+            (0.3, 0.65)
+        )
         
-        # Measure flux at each point
-        flux_L4 = lc_folded.flux[L4_mask].value
-        flux_L5 = lc_folded.flux[L5_mask].value
-        flux_baseline = lc_folded.flux[baseline_mask].value
+        # Measure mean flux at each point
+        n_L4, flux_L4, scatter_L4 = self._window_stats(L4_window)
+        n_L5, flux_L5, scatter_L5 = self._window_stats(L5_window)
+        _, flux_baseline, _ = self._window_stats(*baseline_windows)
         
         # Calculate depths (positive = dimming)
-        depth_L4 = (1 - np.median(flux_L4)/np.median(flux_baseline)) * 1e6
-        depth_L5 = (1 - np.median(flux_L5)/np.median(flux_baseline)) * 1e6
+        depth_L4 = (1 - flux_L4/flux_baseline) * 1e6
+        depth_L5 = (1 - flux_L5/flux_baseline) * 1e6
         
-        # Calculate uncertainties (bootstrap)
-        std_L4 = np.std(flux_L4) / np.sqrt(len(flux_L4)) * 1e6
-        std_L5 = np.std(flux_L5) / np.sqrt(len(flux_L5)) * 1e6
+        # Calculate uncertainties (standard error of the mean)
+        std_L4 = scatter_L4 / np.sqrt(n_L4) * 1e6
+        std_L5 = scatter_L5 / np.sqrt(n_L5) * 1e6
         
         # Statistical significance
         sigma_L4 = depth_L4 / std_L4 if std_L4 > 0 else 0
@@ -146,25 +321,25 @@ class TrojanSearch:
                 'depth_ppm': depth_L4,
                 'uncertainty_ppm': std_L4,
                 'significance_sigma': sigma_L4,
-                'n_points': len(flux_L4)
+                'n_points': n_L4
             },
             'L5': {
                 'depth_ppm': depth_L5,
                 'uncertainty_ppm': std_L5,
                 'significance_sigma': sigma_L5,
-                'n_points': len(flux_L5)
+                'n_points': n_L5
             }
         }
         
         print(f"\n  L4 Results:")
         print(f"    Depth: {depth_L4:.1f} ± {std_L4:.1f} ppm")
         print(f"    Significance: {sigma_L4:.2f}σ")
-        print(f"    Data points: {len(flux_L4)}")
+        print(f"    Data points: {n_L4}")
         
         print(f"\n  L5 Results:")
         print(f"    Depth: {depth_L5:.1f} ± {std_L5:.1f} ppm")
         print(f"    Significance: {sigma_L5:.2f}σ")
-        print(f"    Data points: {len(flux_L5)}")
+        print(f"    Data points: {n_L5}")
         
         # Detection threshold: 3σ
         detection_threshold = 3.0
@@ -184,43 +359,48 @@ class TrojanSearch:
         
         fig = plt.figure(figsize=(16, 10))
         
-        # Plot 1: Full light curve
+        # Plot 1: Full light curve (strided 1-px markers keep rendering cheap)
         ax1 = plt.subplot(2, 3, 1)
-        self.lc_clean.scatter(ax=ax1, s=1, c='black', alpha=0.3)
+        step = max(1, len(self.lc_clean) // 20000)
+        ax1.plot(self.lc_clean.time.value[::step], self.lc_clean.flux.value[::step],
+                 '.', ms=1, c='black', alpha=0.3)
         ax1.set_title('Full TESS Light Curve', fontweight='bold', fontsize=12)
+        ax1.set_xlabel('Time - 2457000 [BTJD days]')
+        ax1.set_ylabel('Normalized Flux')
         
         # Plot 2: Known planet (zoomed)
         ax2 = plt.subplot(2, 3, 2)
-        lc_folded = self.lc_clean.fold(period=self.period, epoch_time=self.epoch)
+        self._get_folded()
+        phase = self._phase_sorted
+        flux = self._flux_sorted
+        known_window = self._phase_slice(-0.15, 0.15)
         
         # Bin for clarity
         phase_bins = np.linspace(-0.15, 0.15, 50)
-        binned_flux = []
-        binned_phase = []
-        for i in range(len(phase_bins)-1):
-            mask = (lc_folded.phase.value > phase_bins[i]) & \
-                   (lc_folded.phase.value < phase_bins[i+1])
-            if np.sum(mask) > 0:
-                binned_flux.append(np.median(lc_folded.flux[mask].value))
-                binned_phase.append((phase_bins[i] + phase_bins[i+1])/2)
-        
-        lc_folded.scatter(ax=ax2, s=1, c='gray', alpha=0.3, label='Raw data')
+        binned_phase, binned_flux = _bin_median(phase, flux, phase_bins)
+        
+        ax2.hexbin(phase[known_window], flux[known_window], gridsize=(100, 50),
+                   cmap='Greys', mincnt=1, vmin=0)
+        # Hexbin collections have no single legend colour; use a proxy
+        ax2.plot([], [], 's', color='gray', label='Raw data')
         ax2.plot(binned_phase, binned_flux, 'r.-', linewidth=2, 
                 markersize=8, label='Binned')
         ax2.set_xlim(-0.15, 0.15)
         ax2.set_title(f'Known Planet\nDepth: {self.known_depth:.0f} ppm', 
                      fontweight='bold', fontsize=12)
+        ax2.set_xlabel('Phase [JD]')
+        ax2.set_ylabel('Normalized Flux')
         ax2.legend()
         ax2.axhline(1.0, color='k', ls='--', alpha=0.3)
         
         # Plot 3: Transit timing (O-C)
         ax3 = plt.subplot(2, 3, 3)
         # Calculate O-C if sufficient transits
-        transit_times = self.epoch + np.arange(0, 100) * self.period
-        transit_times = transit_times[
-            (transit_times > self.lc_clean.time.value[0]) & 
-            (transit_times < self.lc_clean.time.value[-1])
-        ]
+        # Transit numbers n with t_start <= epoch + n*period <= t_end
+        t_start, t_end = self.lc_clean.time.value[[0, -1]]
+        n_first = int(np.ceil((t_start - self.epoch) / self.period))
+        n_last = int(np.floor((t_end - self.epoch) / self.period))
+        transit_times = self.epoch + np.arange(n_first, n_last + 1) * self.period
         
         ax3.text(0.5, 0.5, 'Transit Timing (O-C)\n\nInsufficient Data', 
                 ha='center', va='center', transform=ax3.transAxes,
@@ -232,23 +412,15 @@ class TrojanSearch:
         # Plot 4: L4 point
         ax4 = plt.subplot(2, 3, 4)
         L4_phase = -1/6
-        L4_mask = np.abs(lc_folded.phase.value - L4_phase) < 0.1
-        
-        lc_L4 = lc_folded[L4_mask]
-        lc_L4_sorted = lc_L4[np.argsort(lc_L4.phase.value)]
+        L4_window = self._phase_slice(L4_phase-0.1, L4_phase+0.1)
         
         # Bin
         phase_bins = np.linspace(L4_phase-0.1, L4_phase+0.1, 30)
-        binned_flux = []
-        binned_phase = []
-        for i in range(len(phase_bins)-1):
-            mask = (lc_L4_sorted.phase.value > phase_bins[i]) & \
-                   (lc_L4_sorted.phase.value < phase_bins[i+1])
-            if np.sum(mask) > 0:
-                binned_flux.append(np.median(lc_L4_sorted.flux[mask].value))
-                binned_phase.append((phase_bins[i] + phase_bins[i+1])/2)
-        
-        lc_L4_sorted.scatter(ax=ax4, s=1, c='orange', alpha=0.3)
+        binned_phase, binned_flux = _bin_median(
+            phase[L4_window], flux[L4_window], phase_bins)
+        
+        ax4.hexbin(phase[L4_window], flux[L4_window], gridsize=(100, 50),
+                   cmap='Oranges', mincnt=1, vmin=0)
         ax4.plot(binned_phase, binned_flux, 'k.-', linewidth=2, markersize=6)
         ax4.axhline(1.0, color='gray', ls='--', alpha=0.5)
         ax4.set_title(f'L4: {self.results["L4"]["depth_ppm"]:.1f} ppm ' +
@@ -260,23 +432,15 @@ class TrojanSearch:
         # Plot 5: L5 point
         ax5 = plt.subplot(2, 3, 5)
         L5_phase = +1/6
-        L5_mask = np.abs(lc_folded.phase.value - L5_phase) < 0.1
-        
-        lc_L5 = lc_folded[L5_mask]
-        lc_L5_sorted = lc_L5[np.argsort(lc_L5.phase.value)]
+        L5_window = self._phase_slice(L5_phase-0.1, L5_phase+0.1)
         
         # Bin
         phase_bins = np.linspace(L5_phase-0.1, L5_phase+0.1, 30)
-        binned_flux = []
-        binned_phase = []
-        for i in range(len(phase_bins)-1):
-            mask = (lc_L5_sorted.phase.value > phase_bins[i]) & \
-                   (lc_L5_sorted.phase.value < phase_bins[i+1])
-            if np.sum(mask) > 0:
-                binned_flux.append(np.median(lc_L5_sorted.flux[mask].value))
-                binned_phase.append((phase_bins[i] + phase_bins[i+1])/2)
-        
-        lc_L5_sorted.scatter(ax=ax5, s=1, c='purple', alpha=0.3)
+        binned_phase, binned_flux = _bin_median(
+            phase[L5_window], flux[L5_window], phase_bins)
+        
+        ax5.hexbin(phase[L5_window], flux[L5_window], gridsize=(100, 50),
+                   cmap='Purples', mincnt=1, vmin=0)
         ax5.plot(binned_phase, binned_flux, 'k.-', linewidth=2, markersize=6)
         ax5.axhline(1.0, color='gray', ls='--', alpha=0.5)
         ax5.set_title(f'L5: {self.results["L5"]["depth_ppm"]:.1f} ppm ' +
@@ -341,47 +505,71 @@ Status: No Trojan detected
         
         return fig
 
+def run_target(params):
+    """
+    Run the full Trojan search for one target
+    
+    params holds the TrojanSearch arguments plus 'save_filename'. Returns
+    (results, pickled figure) so this can run in a worker process; the
+    figure is pickled while still registered with pyplot, so pickle.loads
+    re-opens it in the caller, and then closed here so reused workers do
+    not accumulate figures.
+    """
+    params = dict(params)
+    save_filename = params.pop('save_filename', None)
+    
+    search = TrojanSearch(**params)
+    search.download_data()
+    search.preprocess()
+    search.validate_known_planet()
+    search.search_lagrange_points()
+    fig = search.visualize(save_filename=save_filename)
+    fig_pickle = pickle.dumps(fig)
+    plt.close(fig)
+    return search.results, fig_pickle
+
 # ============================================================================
 # EXAMPLE USAGE
 # ============================================================================
 
 if __name__ == "__main__":
     
-    # Example 1: HAT-P-7 b
-    print("\n" + "="*70)
-    print("EXAMPLE 1: HAT-P-7 b")
-    print("="*70)
-    
-    hatp7 = TrojanSearch(
-        target_name="TIC 424865156",  # HAT-P-7
-        planet_period=2.204730,
-        planet_epoch=2454954.357,
-        planet_depth_ppm=700  # 0.07%
-    )
-    
-    hatp7.download_data()
-    hatp7.preprocess()
-    hatp7.validate_known_planet()
-    hatp7.search_lagrange_points()
-    hatp7.visualize(save_filename='HAT-P-7_trojan_search.png')
-    
-    # Example 2: TOI-2109 (ultra-hot Jupiter)
-    print("\n" + "="*70)
-    print("EXAMPLE 2: TOI-2109 b (Ultra-hot Jupiter)")
-    print("="*70)
+    examples = [
+        ("HAT-P-7 b", dict(
+            target_name="TIC 424865156",  # HAT-P-7
+            planet_period=2.204730,
+            planet_epoch=2454954.357,
+            planet_depth_ppm=700,  # 0.07%
+            save_filename='HAT-P-7_trojan_search.png'
+        )),
+        ("TOI-2109 b (Ultra-hot Jupiter)", dict(
+            target_name="TIC 392476080",  # TOI-2109
+            planet_period=0.67246,
+            planet_epoch=2458679.0,
+            planet_depth_ppm=18000,  # 1.8%
+            save_filename='TOI-2109_trojan_search.png'
+        )),
+    ]
     
-    toi2109 = TrojanSearch(
-        target_name="TIC 392476080",  # TOI-2109
-        planet_period=0.67246,
-        planet_epoch=2458679.0,
-        planet_depth_ppm=18000  # 1.8%
-    )
+    # Targets are independent (network download, then CPU-bound detrending),
+    # so search them concurrently; progress output may interleave. Workers
+    # draw off-screen and their figures are unpickled here for plt.show()
+    with ProcessPoolExecutor(max_workers=len(examples),
+                             initializer=plt.switch_backend,
+                             initargs=('Agg',)) as executor:
+        all_results = list(executor.map(run_target,
+                                        [params for _, params in examples]))
     
-    toi2109.download_data()
-    toi2109.preprocess()
-    toi2109.validate_known_planet()
-    toi2109.search_lagrange_points()
-    toi2109.visualize(save_filename='TOI-2109_trojan_search.png')
+    for i, ((name, _), (results, fig_pickle)) in enumerate(
+            zip(examples, all_results), start=1):
+        pickle.loads(fig_pickle)
+        print("\n" + "="*70)
+        print(f"EXAMPLE {i}: {name}")
+        print("="*70)
+        for point in ('L4', 'L5'):
+            r = results[point]
+            print(f"  {point}: {r['depth_ppm']:.1f} ± {r['uncertainty_ppm']:.1f} ppm "
+                  f"({r['significance_sigma']:.1f}σ)")
     
     plt.show()
     